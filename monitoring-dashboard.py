@@ -1,9 +1,15 @@
 import time
 import json
+import re
+import functools
+import contextlib
 import logging
 import traceback
 import base64
 import os
+import sys
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.common.exceptions import (
@@ -12,22 +18,95 @@ from selenium.common.exceptions import (
     NoSuchElementException,
     NoSuchFrameException,
     ElementClickInterceptedException,
-    ElementNotInteractableException,
-    StaleElementReferenceException
+    ElementNotInteractableException
 )
 from selenium.webdriver.chrome.options import Options as ChromeOptions
 from selenium.webdriver.firefox.options import Options as FirefoxOptions
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 
+# orjson is optional; fall back to the standard library parser without it
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+def resolve_config_path(config_file):
+    """
+    Return the path of the config file to load. A config.json in the working
+    directory takes precedence; otherwise fall back to the one bundled next to
+    the script (or inside the PyInstaller bundle when running frozen).
+    """
+    if os.path.isabs(config_file) or os.path.exists(config_file):
+        return config_file
+    base_dir = getattr(sys, '_MEIPASS', os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(base_dir, config_file)
+
 def load_config(config_file='config.json'):
-    with open(config_file, 'r') as f:
-        config = json.load(f)
+    with open(resolve_config_path(config_file), 'rb') as f:
+        config = _json_loads(f.read())
     # Expand the user_data_dir if it contains '~'
     if 'user_data_dir' in config:
         config['user_data_dir'] = os.path.expanduser(config['user_data_dir'])
     return config
 
+DEFAULT_CONFIG = {
+    'urls': [],
+    'nagios_credentials': {},
+    'run_pre_actions': False,
+    'mode': 'SingleTab',
+    'min_display_time': 30,
+    'max_display_time': 120,
+    'scroll_pause_at_top': 2,
+    'scroll_pause_at_bottom': 5,
+    'do_periodic_refresh': False,
+    'refresh_interval': 3600,
+    'scaling_factor': 0.02,
+    'browser': 'chrome',
+    'chromedriver_path': '',
+    'log_level': 'INFO',
+    'log_file': 'dashboard_rotator.log',
+    'page_load_timeout': 60,
+    'page_load_strategy': 'eager',
+    'load_images': True,
+    # Grafana renders its panels by XHR after the load event
+    'ready_xpaths': {
+        'grafana': "//div[contains(@class, 'react-grid-item')]",
+    },
+    'block_patterns': [],
+    'user_data_dir': None,
+    'profile_directory': None,
+}
+
+def build_settings(config):
+    """
+    Merge the loaded config over DEFAULT_CONFIG and freeze it into a namespace,
+    so the rotation loop reads plain attributes instead of resolving
+    config.get() defaults on every iteration.
+    """
+    settings = SimpleNamespace(**{**DEFAULT_CONFIG, **config})
+    # Normalize the case-insensitive choices once instead of at every use
+    settings.browser = settings.browser.lower()
+    settings.mode = settings.mode.lower()
+    # The Basic auth header never changes, so encode it once up front
+    nagios_credentials = settings.nagios_credentials
+    nagios_username = nagios_credentials.get('username', '')
+    nagios_password = nagios_credentials.get('password', '')
+    settings.nagios_auth_header = None
+    if nagios_username and nagios_password:
+        credentials = f"{nagios_username}:{nagios_password}"
+        settings.nagios_auth_header = f"Basic {base64.b64encode(credentials.encode()).decode()}"
+    return settings
+
+def log_traceback():
+    """
+    Log the current exception's traceback at DEBUG level, skipping the
+    formatting entirely when DEBUG output is disabled.
+    """
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug(traceback.format_exc())
+
 def configure_logging(log_level, log_file):
     numeric_level = getattr(logging, log_level.upper(), None)
     if not isinstance(numeric_level, int):
@@ -42,11 +121,12 @@ def configure_logging(log_level, log_file):
     )
 
 def init_driver(config):
-    browser = config.get('browser', 'chrome').lower()
+    browser = config.browser
     driver = None
 
     if browser == 'chrome':
         options = ChromeOptions()
+        options.page_load_strategy = config.page_load_strategy
         options.add_argument("--start-fullscreen")
         options.add_argument("--disable-extensions")
         options.add_argument("--disable-popup-blocking")
@@ -62,14 +142,18 @@ def init_driver(config):
         options.add_experimental_option("excludeSwitches", ["enable-automation", "enable-logging"])
         options.add_experimental_option("useAutomationExtension", False)
 
+        # Skip image downloads and decoding when the dashboards don't need them
+        if not config.load_images:
+            options.add_argument("--blink-settings=imagesEnabled=false")
+
         # Add options to prevent background tab throttling
         options.add_argument("--disable-background-timer-throttling")
         options.add_argument("--disable-backgrounding-occluded-windows")
         options.add_argument("--disable-renderer-backgrounding")
 
         # Specify the user data directory and profile
-        user_data_dir = config.get('user_data_dir')
-        profile_directory = config.get('profile_directory')
+        user_data_dir = config.user_data_dir
+        profile_directory = config.profile_directory
 
         if user_data_dir:
             options.add_argument(f"--user-data-dir={user_data_dir}")
@@ -83,21 +167,136 @@ def init_driver(config):
             logging.error("Profile directory is not specified in the configuration.")
             raise ValueError("Profile directory is required when using a custom profile.")
 
-        chromedriver_path = config.get('chromedriver_path', '')
+        chromedriver_path = config.chromedriver_path
         if chromedriver_path:
             driver = webdriver.Chrome(executable_path=chromedriver_path, options=options)
         else:
             driver = webdriver.Chrome(options=options)
     elif browser == 'firefox':
         options = FirefoxOptions()
+        options.page_load_strategy = config.page_load_strategy
         options.add_argument("--kiosk")
+        if not config.load_images:
+            options.set_preference("permissions.default.image", 2)
+            options.set_preference("image.animation_mode", "none")
         driver = webdriver.Firefox(options=options)
     else:
-        logging.error(f"Unsupported browser specified: {browser}")
+        logging.error("Unsupported browser specified: %s", browser)
         raise ValueError(f"Unsupported browser specified: {browser}")
-    driver.set_page_load_timeout(config.get('page_load_timeout', 60))
+    driver.set_page_load_timeout(config.page_load_timeout)
+    # Bookkeeping used to skip redundant WebDriver/CDP round-trips
+    driver._md_current_handle = driver.current_window_handle
+    driver._md_in_frame = False
+    driver._md_tab_headers = {}  # window handle -> extra HTTP headers last applied
+    prepare_tab(driver, config)
     return driver
 
+# Page-side helpers installed once per document (via CDP on Chrome) so that
+# scroll_page only has to send short calls such as window.__md.metrics(sel).
+# The scroll container is always passed as a CSS selector and resolved inside
+# the page, so no selenium element reference can go stale mid-scroll.
+#   container(sel): the element matching `sel`, or null for the window.
+#   metrics(sel): [scrollHeight, clientHeight, centerX, centerY, found] of the
+#     container, or of the document when there is none. The center point is
+#     the viewport's, where a window scroll gesture is aimed; `found` tells
+#     whether `sel` matched.
+#   scroll(sel, distance, duration, maxStale, done): scrolls the container (or
+#     the window) down by `distance` px over `duration` ms using
+#     requestAnimationFrame, then calls `done`. If the container stays missing
+#     for `maxStale` consecutive frames it stops and calls done('stale').
+#   toBottom(sel): jumps the container (or the window) to the very bottom.
+SCROLL_HELPER_JS = """
+window.__md = {
+    container: function (sel) {
+        return sel ? document.querySelector(sel) : null;
+    },
+    metrics: function (sel) {
+        var el = window.__md.container(sel);
+        var centerX = Math.round(window.innerWidth / 2), centerY = Math.round(window.innerHeight / 2);
+        if (el) {
+            return [el.scrollHeight, el.clientHeight, centerX, centerY, true];
+        }
+        return [document.body.scrollHeight || 1000, window.innerHeight || 800, centerX, centerY, false];
+    },
+    scroll: function (sel, distance, duration, maxStale, done) {
+        var el = window.__md.container(sel);
+        var start = performance.now();
+        var stale = 0;
+        function step(now) {
+            var progress = Math.min(1, (now - start) / duration);
+            if (el && !el.isConnected) {
+                // The container was re-rendered: look it up again, at most once a frame
+                var fresh = window.__md.container(sel);
+                if (!fresh) {
+                    if (++stale >= maxStale) {
+                        done('stale');
+                    } else {
+                        window.requestAnimationFrame(step);
+                    }
+                    return;
+                }
+                el = fresh;
+            }
+            stale = 0;
+            // Each position is derived from the elapsed time, so no error accumulates
+            var position = Math.round(distance * progress);
+            if (el) {
+                el.scrollTop = position;
+            } else {
+                window.scrollTo(0, position);
+            }
+            if (progress < 1) {
+                window.requestAnimationFrame(step);
+            } else {
+                done();
+            }
+        }
+        window.requestAnimationFrame(step);
+    },
+    toBottom: function (sel) {
+        var el = window.__md.container(sel);
+        if (el) {
+            el.scrollTop = el.scrollHeight;
+        } else {
+            window.scrollTo(0, document.body.scrollHeight);
+        }
+    }
+};
+"""
+
+def get_scroll_metrics(driver, scrollable_element_selector):
+    """
+    Return [scrollHeight, clientHeight, centerX, centerY, found] for the
+    container or the document, installing the page helpers first if they are
+    missing (Firefox, where they cannot be registered ahead of time).
+    """
+    metrics = driver.execute_script("return window.__md ? window.__md.metrics(arguments[0]) : null;",
+                                    scrollable_element_selector)
+    if metrics is None:
+        metrics = driver.execute_script(SCROLL_HELPER_JS + "return window.__md.metrics(arguments[0]);",
+                                        scrollable_element_selector)
+    return metrics
+
+# Consecutive animation frames the scroll container may be missing before the scroll is aborted
+SCROLL_MAX_STALE_FRAMES = 30
+
+def run_scroll_animation(driver, scrollable_element_selector, max_scroll_distance, display_time):
+    """
+    Scroll with a single in-page requestAnimationFrame animation. The async
+    script returns as soon as the animation calls back, so there is no need
+    to sleep and then poll for completion. Returns False if the scroll was
+    aborted because the container disappeared.
+    """
+    original_timeout = driver.timeouts.script
+    driver.set_script_timeout(display_time + 10)
+    try:
+        result = driver.execute_async_script(
+            "window.__md.scroll(arguments[0], arguments[1], arguments[2], arguments[3], arguments[4]);",
+            scrollable_element_selector, max_scroll_distance, display_time * 1000, SCROLL_MAX_STALE_FRAMES)
+    finally:
+        driver.set_script_timeout(original_timeout)
+    return result != 'stale'
+
 def scroll_page(driver, config, scrollable_element_selector=None):
     """
     Scrolls the page (or a scrollable container if selector is provided) while
@@ -108,201 +307,260 @@ def scroll_page(driver, config, scrollable_element_selector=None):
     original_timeout = driver.timeouts.script
     driver.set_script_timeout(10)  # 10 seconds max for JS execution
     try:
-        scroll_pause_at_top = config.get('scroll_pause_at_top', 2)
-        scroll_pause_at_bottom = config.get('scroll_pause_at_bottom', 5)
-        scroll_step_duration = config.get('scroll_step_duration', 0.01)
+        scroll_pause_at_top = config.scroll_pause_at_top
+        scroll_pause_at_bottom = config.scroll_pause_at_bottom
 
-        logging.debug(f"Pausing at the top of the page for {scroll_pause_at_top} seconds.")
+        logging.debug("Pausing at the top of the page for %s seconds.", scroll_pause_at_top)
         time.sleep(scroll_pause_at_top)
 
-        # Locate scrollable element if a selector is provided
-        scrollable_element = None
-        if scrollable_element_selector:
-            try:
-                scrollable_element = driver.find_element(By.CSS_SELECTOR, scrollable_element_selector)
-            except NoSuchElementException:
-                logging.error(f"Could not find the scrollable container using selector: {scrollable_element_selector}")
-
-        # Determine the total scrollable height
-        if scrollable_element:
-            total_height = driver.execute_script("return arguments[0].scrollHeight", scrollable_element)
-            client_height = driver.execute_script("return arguments[0].clientHeight", scrollable_element)
-        else:
-            total_height = driver.execute_script("return document.body.scrollHeight") or 1000
-            client_height = driver.execute_script("return window.innerHeight") or 800
+        # Determine the total scrollable height in a single round-trip
+        total_height, client_height, center_x, center_y, found = get_scroll_metrics(
+            driver, scrollable_element_selector)
+        if scrollable_element_selector and not found:
+            logging.error("Could not find the scrollable container using selector: %s", scrollable_element_selector)
+            scrollable_element_selector = None
 
         max_scroll_distance = total_height - client_height
         is_scrollable = max_scroll_distance > 0 # Check if the page is scrollable
-        display_time = calculate_display_time(total_height, config, is_scrollable)
+        display_time = calculate_display_time(total_height, config.min_display_time, config.max_display_time,
+                                              config.scaling_factor, is_scrollable)
 
         if not is_scrollable:
-            logging.info(f"Page is not scrollable. Skipping scrolling. Pausing for {display_time} seconds.")
+            logging.info("Page is not scrollable. Skipping scrolling. Pausing for %s seconds.", display_time)
             time.sleep(display_time)
             return  # Exit the function since there's nothing to scroll
 
-        steps = max(int(display_time / scroll_step_duration), 1)
-        scroll_increment = max_scroll_distance / steps
-
-        logging.info(f"Total height: {total_height}px")
-        logging.info(f"Client height: {client_height}px")
-        logging.info(f"Max scroll distance: {max_scroll_distance}px")
-        logging.info(f"Display time: {display_time:.2f}s")
-        logging.info(f"Number of steps: {steps}")
-        logging.info(f"Scroll increment: {scroll_increment:.2f}px per step")
-
-        current_position = 0
-        for _ in range(steps):
+        logging.info("Total height: %spx", total_height)
+        logging.info("Client height: %spx", client_height)
+        logging.info("Max scroll distance: %spx", max_scroll_distance)
+        logging.info("Display time: %.2fs", display_time)
+
+        # On Chrome, let DevTools scroll the top-level window as one native
+        # gesture; the command returns once the gesture has finished. Its point
+        # is in top-level viewport coordinates and it scrolls whatever is under
+        # that point, so containers and framed pages use the in-page animation.
+        # With no time to animate over, just jump to the bottom below
+        scrolled = display_time <= 0
+        if not scrolled and config.browser == 'chrome' and not scrollable_element_selector and not driver._md_in_frame:
             try:
-                # Re-locate if we have a selector
-                if scrollable_element_selector:
-                    scrollable_element = driver.find_element(By.CSS_SELECTOR, scrollable_element_selector)
-                    driver.execute_script("arguments[0].scrollTop = arguments[1];",
-                                          scrollable_element, current_position)
-                else:
-                    driver.execute_script(f"window.scrollTo(0, {current_position});")
-
-                current_position += scroll_increment
-                time.sleep(scroll_step_duration)
-
-            except StaleElementReferenceException:
-                logging.warning("Encountered StaleElementReferenceException while scrolling. Re-locating element.")
-                # Re-locate or simply break depending on your needs
-                if scrollable_element_selector:
-                    try:
-                        scrollable_element = driver.find_element(By.CSS_SELECTOR, scrollable_element_selector)
-                        # Optionally retry the same scroll step
-                        driver.execute_script("arguments[0].scrollTop = arguments[1];",
-                                              scrollable_element, current_position)
-                    except NoSuchElementException:
-                        logging.error("Scroll element disappeared entirely. Stopping scroll.")
-                        break
-                else:
-                    # If there's no specific container, just continue with window scroll
-                    driver.execute_script(f"window.scrollTo(0, {current_position});")
-
-            except NoSuchElementException:
-                logging.error("Scroll element no longer exists. Stopping scroll.")
-                break
+                driver.execute_cdp_cmd("Input.synthesizeScrollGesture", {
+                    "x": center_x,
+                    "y": center_y,
+                    "xDistance": 0,
+                    "yDistance": -max_scroll_distance,
+                    "speed": max(int(max_scroll_distance / display_time), 1),
+                })
+                scrolled = True
+            except WebDriverException as e:
+                logging.warning("CDP scroll gesture failed, using in-page animation: %s", e)
+        if not scrolled:
+            # Animate the scroll from inside the page (Firefox has no CDP)
+            if not run_scroll_animation(driver, scrollable_element_selector, max_scroll_distance, display_time):
+                logging.warning("Scroll container disappeared during the scroll. Stopping scroll.")
 
         # Ensure we reach the bottom
         try:
-            if scrollable_element_selector:
-                scrollable_element = driver.find_element(By.CSS_SELECTOR, scrollable_element_selector)
-                driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight;", scrollable_element)
-            else:
-                driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+            driver.execute_script("window.__md.toBottom(arguments[0]);", scrollable_element_selector)
         except Exception as e:
-            logging.error(f"Error ensuring we reach bottom: {e}")
+            logging.error("Error ensuring we reach bottom: %s", e)
 
-        logging.debug(f"Pausing at the bottom of the page for {scroll_pause_at_bottom} seconds.")
+        logging.debug("Pausing at the bottom of the page for %s seconds.", scroll_pause_at_bottom)
         time.sleep(scroll_pause_at_bottom)
 
     except Exception as e:
-        logging.error(f"Error in scroll_page: {e}")
-        logging.debug(traceback.format_exc())
+        logging.error("Error in scroll_page: %s", e)
+        log_traceback()
         raise
+    finally:
+        driver.set_script_timeout(original_timeout)
 
-def calculate_display_time(total_height, config, is_scrollable=True):
-    min_display_time = config.get('min_display_time', 30)
-    max_display_time = config.get('max_display_time', 120)
-    scaling_factor = config.get('scaling_factor', 0.02)
-
+def calculate_display_time(total_height, min_display_time, max_display_time, scaling_factor, is_scrollable=True):
     if not is_scrollable:
         return min_display_time
 
     display_time = total_height * scaling_factor
     display_time = max(min_display_time, min(display_time, max_display_time))
-    logging.debug(f"Calculated display time: {display_time:.2f} seconds for page height: {total_height}px.")
+    logging.debug("Calculated display time: %.2f seconds for page height: %spx.", display_time, total_height)
     return display_time
 
 def refresh_session_if_needed(driver, last_refresh_time, config, current_url):
-    refresh_interval = config.get('refresh_interval', 3600)
+    refresh_interval = config.refresh_interval
     current_time = time.time()
     if current_time - last_refresh_time > refresh_interval:
-        logging.info(f"Refreshing the browser session to prevent timeout. [{current_url}]")
-        success = load_url(driver, current_url, config)
+        logging.info("Refreshing the browser session to prevent timeout. [%s]", current_url)
+        success = reload_url(driver, current_url, config)
         if not success:
-            logging.error(f"Failed to reload URL: {current_url}")
+            logging.error("Failed to reload URL: %s", current_url)
         return current_time
     return last_refresh_time
 
-def wait_for_page_load(driver, timeout, check_element_xpath=None):
+# document.readyState values at which each page load strategy considers a
+# navigation finished
+READY_STATES = {
+    'normal': ['complete'],
+    'eager': ['interactive', 'complete'],
+    'none': ['loading', 'interactive', 'complete'],
+}
+
+# Seconds between two polls of an explicit wait, tighter than the 0.5s default
+WAIT_POLL_FREQUENCY = 0.2
+
+def wait_for_page_load(driver, timeout, check_element_xpath=None, ready_states=None):
+    """
+    Wait until the current page is usable. driver.get() and driver.refresh()
+    already block according to the page load strategy, so by default only the
+    optional element is waited for. Navigations started from a script do not
+    block; pass `ready_states` to also wait until the tab has left its blank
+    start page and the new document has reached one of those readyStates.
+    """
     try:
-        # Wait until document is completely loaded
-        WebDriverWait(driver, timeout).until(
-            lambda d: d.execute_script('return document.readyState') == 'complete'
-        )
-        logging.debug("Initial page load complete")
+        if ready_states:
+            WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
+                lambda d: d.execute_script(
+                    "return location.protocol.indexOf('http') === 0 && arguments[0].indexOf(document.readyState) !== -1;",
+                    ready_states)
+            )
+            logging.debug("Initial page load complete")
 
         if check_element_xpath:
             # If a specific element is provided, wait for that element to be visible
-            WebDriverWait(driver, timeout).until(
+            WebDriverWait(driver, timeout, poll_frequency=WAIT_POLL_FREQUENCY).until(
                 EC.visibility_of_element_located((By.XPATH, check_element_xpath))
             )
-            logging.debug(f"Element located: {check_element_xpath}")
+            logging.debug("Element located: %s", check_element_xpath)
 
         return True
 
     except TimeoutException:
-        logging.warning(f"Page load timed out after {timeout} seconds but continuing.")
+        logging.warning("Page load timed out after %s seconds but continuing.", timeout)
     except Exception as e:
-        logging.error(f"Error while waiting for page load: {e}")
-        logging.debug(traceback.format_exc())
+        logging.error("Error while waiting for page load: %s", e)
+        log_traceback()
+
+# Minimum number of seconds between two screenshots of the same error
+SCREENSHOT_INTERVAL = 60
+_last_screenshot_at = {}
+# A single worker writes the screenshots in the order they were taken
+_screenshot_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="screenshot")
+
+def _write_screenshot(filename, png):
+    try:
+        with open(filename, 'wb') as f:
+            f.write(png)
+    except OSError as e:
+        logging.error("Failed to write screenshot %s: %s", filename, e)
+
+def save_error_screenshot(driver, filename):
+    """
+    Save a diagnostic screenshot, at most once per SCREENSHOT_INTERVAL for a
+    given filename, so a flapping dashboard does not pay for a full-page
+    capture on every rotation. Only the capture runs on the caller's thread;
+    the file is written in the background.
+    """
+    now = time.time()
+    if now - _last_screenshot_at.get(filename, 0) < SCREENSHOT_INTERVAL:
+        logging.debug("Skipping screenshot %s, one was taken recently.", filename)
+        return
+    _last_screenshot_at[filename] = now
+    try:
+        png = driver.get_screenshot_as_png()
+    except Exception as e:
+        logging.error("Failed to save screenshot %s: %s", filename, e)
+        return
+    _screenshot_writer.submit(_write_screenshot, filename, png)
 
 # ------------------ CDP Functions ------------------
-def set_nagios_basic_auth(driver, nagios_username, nagios_password):
-    logging.debug("Setting HTTP Basic Authentication headers for Nagios via CDP.")
+def prepare_tab(driver, config):
+    """
+    Apply the per-tab DevTools settings to the current tab. CDP state is scoped
+    to a single tab, so this must run for every tab the script opens.
+    """
+    if config.browser != 'chrome':
+        return
     try:
-        # Enable the Network domain
+        # Register the scroll helpers for every document this tab loads
+        driver.execute_cdp_cmd("Page.enable", {})
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": SCROLL_HELPER_JS})
+    except Exception as e:
+        logging.error("Failed to register the scroll helpers: %s", e)
+        log_traceback()
+
+    try:
+        # Enable the Network domain once per tab for the header/blocking commands
         driver.execute_cdp_cmd("Network.enable", {})
-        
-        # Encode credentials
-        credentials = f"{nagios_username}:{nagios_password}"
-        encoded_credentials = base64.b64encode(credentials.encode()).decode()
-
-        # Set the Authorization header
-        driver.execute_cdp_cmd(
-            "Network.setExtraHTTPHeaders",
-            {"headers": {"Authorization": f"Basic {encoded_credentials}"}}
-        )
-        logging.info("HTTP Basic Authentication headers set via CDP.")
+        # A new tab starts without extra headers, so the first reset can be skipped
+        driver._md_tab_headers[driver._md_current_handle] = {}
+        block_patterns = config.block_patterns
+        if block_patterns:
+            logging.debug("Blocking requests matching: %s", block_patterns)
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": block_patterns})
     except Exception as e:
-        logging.error(f"Failed to set HTTP Basic Authentication headers for Nagios: {e}")
-        driver.save_screenshot("error_cdp_auth_nagios.png")
-        logging.debug(traceback.format_exc())
+        logging.error("Failed to configure the Network domain: %s", e)
+        log_traceback()
+
+def wake_tab(driver, config):
+    """
+    Unfreeze the current tab if Chrome froze it while it was in the background.
+    This only changes the page's current state, so it is sent each time the
+    rotation comes back to a tab.
+    """
+    if config.browser != 'chrome':
+        return
+    try:
+        driver.execute_cdp_cmd("Page.setWebLifecycleState", {"state": "active"})
+    except Exception as e:
+        logging.error("Failed to set the tab lifecycle state: %s", e)
+        log_traceback()
 
-def reset_extra_http_headers(driver):
-    logging.debug("Resetting HTTP Extra Headers via CDP.")
+def set_extra_http_headers(driver, headers):
+    """
+    Replace the current tab's extra HTTP headers with a single CDP call; an
+    empty dict clears them. The Network domain is enabled by prepare_tab().
+    """
+    logging.debug("Setting HTTP Extra Headers via CDP.")
     try:
-        driver.execute_cdp_cmd("Network.setExtraHTTPHeaders", {"headers": {}})
-        logging.info("HTTP Extra Headers have been reset.")
+        driver.execute_cdp_cmd("Network.setExtraHTTPHeaders", {"headers": headers})
+        if 'Authorization' in headers:
+            logging.info("HTTP Basic Authentication headers set via CDP.")
+        else:
+            logging.info("HTTP Extra Headers have been reset.")
+        return True
     except Exception as e:
-        logging.error(f"Failed to reset HTTP Extra Headers: {e}")
-        logging.debug(traceback.format_exc())
+        logging.error("Failed to set HTTP Extra Headers: %s", e)
+        if 'Authorization' in headers:
+            save_error_screenshot(driver, "error_cdp_auth_nagios.png")
+        log_traceback()
+        return False
 
 
 # ------------------ Pre-Action Functions ------------------
 
+# Nagios locators. The links are matched by their text, which CSS selectors cannot do
+AVAN_ALERTS_LOCATOR = (
+    By.XPATH,
+    "//a[contains(@href, '/nagios/cgi-bin/status.cgi') and .//b[contains(text(), 'AVANAN Alerts')]]"
+)
+SERVICE_TOTALS_LOCATOR = (By.CSS_SELECTOR, "th.serviceTotals")
+CRITICAL_LOCATOR = (By.XPATH, "//th[contains(@class, 'serviceTotals')]//a[contains(text(), 'Critical')]")
+
 def pre_action_nagios(driver):
     """
     Navigate to 'AVANAN Alerts' and click on 'Critical'.
     Assumes that HTTP Basic Authentication is already handled via CDP.
     """
+    # One wait object for every step
+    wait = WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY)
+
     try:
         driver.switch_to.frame("side")
     except NoSuchFrameException:
         logging.error("Could not switch to the left frame. It might not exist.")
-        driver.save_screenshot("error_switch_to_left_frame.png")
+        save_error_screenshot(driver, "error_switch_to_left_frame.png")
 
     # Proceed to click "AVANAN Alerts" sidebar link
     try:
         logging.debug("Attempting to locate the 'AVANAN Alerts' sidebar link.")
-        avan_alerts_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((
-                By.XPATH,
-                "//a[contains(@href, '/nagios/cgi-bin/status.cgi') and .//b[contains(text(), 'AVANAN Alerts')]]"
-            ))
-        )
+        avan_alerts_link = wait.until(EC.element_to_be_clickable(AVAN_ALERTS_LOCATOR))
         avan_alerts_link.click()
         logging.info("Clicked 'AVANAN Alerts' sidebar link.")
         
@@ -313,49 +571,38 @@ def pre_action_nagios(driver):
         driver.switch_to.frame("main")
         
         # Wait for the page to load after clicking
-        WebDriverWait(driver, 10).until(
-            EC.presence_of_element_located((
-                By.XPATH,
-                "//th[contains(@class, 'serviceTotals')]"
-            ))
-        )
+        wait.until(EC.presence_of_element_located(SERVICE_TOTALS_LOCATOR))
     except TimeoutException:
         logging.error("Could not find the 'AVANAN Alerts' sidebar link.")
-        driver.save_screenshot("error_avan_alerts_link.png")
-        logging.debug(traceback.format_exc())
+        save_error_screenshot(driver, "error_avan_alerts_link.png")
+        log_traceback()
     except (ElementClickInterceptedException, ElementNotInteractableException) as e:
-        logging.error(f"Could not click the 'AVANAN Alerts' sidebar link: {e}")
-        driver.save_screenshot("error_avan_alerts_click.png")
-        logging.debug(traceback.format_exc())
+        logging.error("Could not click the 'AVANAN Alerts' sidebar link: %s", e)
+        save_error_screenshot(driver, "error_avan_alerts_click.png")
+        log_traceback()
     except Exception as e:
-        logging.error(f"Unexpected error while clicking 'AVANAN Alerts' sidebar link: {e}")
-        driver.save_screenshot("error_avan_alerts_unexpected.png")
-        logging.debug(traceback.format_exc())
+        logging.error("Unexpected error while clicking 'AVANAN Alerts' sidebar link: %s", e)
+        save_error_screenshot(driver, "error_avan_alerts_unexpected.png")
+        log_traceback()
 
     # Proceed to click "Critical" link in service totals
     try:
         logging.debug("Attempting to locate the 'Critical' link in service totals.")
-        critical_link = WebDriverWait(driver, 10).until(
-            EC.element_to_be_clickable((
-                By.XPATH,
-                "//th[contains(@class, 'serviceTotals')]//a[contains(text(), 'Critical')]"
-            ))
-        )
+        critical_link = wait.until(EC.element_to_be_clickable(CRITICAL_LOCATOR))
         critical_link.click()
         logging.info("Clicked 'Critical' link in service totals.")
-        time.sleep(1)
     except TimeoutException:
         logging.error("Could not find the 'Critical' link in service totals.")
-        driver.save_screenshot("error_critical_link.png")
-        logging.debug(traceback.format_exc())
+        save_error_screenshot(driver, "error_critical_link.png")
+        log_traceback()
     except (ElementClickInterceptedException, ElementNotInteractableException) as e:
-        logging.error(f"Could not click the 'Critical' link: {e}")
-        driver.save_screenshot("error_critical_click.png")
-        logging.debug(traceback.format_exc())
+        logging.error("Could not click the 'Critical' link: %s", e)
+        save_error_screenshot(driver, "error_critical_click.png")
+        log_traceback()
     except Exception as e:
-        logging.error(f"Unexpected error while clicking 'Critical' link: {e}")
-        driver.save_screenshot("error_critical_unexpected.png")
-        logging.debug(traceback.format_exc())
+        logging.error("Unexpected error while clicking 'Critical' link: %s", e)
+        save_error_screenshot(driver, "error_critical_unexpected.png")
+        log_traceback()
 
     wait_for_page_load(driver, timeout=60, check_element_xpath="//table[@class='status']/tbody")
 
@@ -375,86 +622,310 @@ PRE_ACTIONS = {
     # 'another_site_identifier': pre_action_another_site,
 }
 
-def load_url(driver, url, config):
-    reset_extra_http_headers(driver)
-
-    if "nagios" in url.lower():
-        # Retrieve Nagios credentials from config
-        nagios_credentials = config.get('nagios_credentials', {})
-        nagios_username = nagios_credentials.get('username', '')
-        nagios_password = nagios_credentials.get('password', '')
-        if nagios_username and nagios_password:
-            set_nagios_basic_auth(driver, nagios_username, nagios_password)
+# Sites whose content scrolls inside a container rather than the window
+SCROLL_CONTAINER_SELECTORS = {
+    'grafana': 'div.scrollbar-view',
+}
+
+# An empty alternation would match every URL, so fall back to a pattern that never matches
+_PRE_ACTION_RE = re.compile("|".join(re.escape(site_identifier) for site_identifier in PRE_ACTIONS) or "(?!)")
+
+@functools.lru_cache(maxsize=None)
+def url_key(url):
+    """Return the lowercased `url` that site identifiers are matched against."""
+    return url.lower()
+
+@functools.lru_cache(maxsize=None)
+def get_pre_action(url):
+    """
+    Return the (site_identifier, pre_action) pair matching `url`, or None.
+    Cached per URL, since the rotation asks about the same URLs every cycle.
+    """
+    match = _PRE_ACTION_RE.search(url_key(url))
+    if not match:
+        return None
+    return match.group(0), PRE_ACTIONS[match.group(0)]
+
+@functools.lru_cache(maxsize=None)
+def get_scroll_container_selector(url):
+    """Return the scroll container selector configured for `url`, or None."""
+    key = url_key(url)
+    for site_identifier, selector in SCROLL_CONTAINER_SELECTORS.items():
+        if site_identifier in key:
+            return selector
+    return None
+
+def apply_auth_headers(driver, url, config):
+    # Extra headers are set through CDP, which only Chrome offers
+    if config.browser != 'chrome':
+        return
+    headers = {}
+    if "nagios" in url_key(url):
+        if config.nagios_auth_header:
+            headers['Authorization'] = config.nagios_auth_header
         else:
             logging.info("No Nagios credentials provided - skipping authentication")
+
+    # Extra headers stick to the tab, so only send them when they change
+    handle = driver._md_current_handle
+    if driver._md_tab_headers.get(handle) == headers:
+        logging.debug("HTTP Extra Headers already set for this tab.")
+        return
+    if set_extra_http_headers(driver, headers):
+        driver._md_tab_headers[handle] = headers
+
+def load_url(driver, url, config):
+    apply_auth_headers(driver, url, config)
     driver.get(url)
-    wait_for_page_load(driver, config.get('page_load_timeout', 60))
-    time.sleep(5)  # Additional wait time for dynamic content
+    # Navigating returns the driver to the top-level context
+    driver._md_in_frame = False
+    wait_for_page_load(driver, config.page_load_timeout, get_ready_xpath(url, config))
     return True  # Indicate success
 
+def reload_url(driver, url, config):
+    """
+    Reload the current tab in place while it still shows `url`, which reuses
+    the browser cache, open connections and the tab's auth headers. Falls back
+    to a full load_url when the tab has navigated elsewhere or the reload fails.
+    """
+    try:
+        if driver.current_url.startswith(url):
+            driver.refresh()
+            wait_for_page_load(driver, config.page_load_timeout, get_ready_xpath(url, config))
+            return True
+        logging.info("Tab has navigated away from %s. Loading it from scratch.", url)
+    except WebDriverException as e:
+        logging.warning("Soft reload failed, loading URL from scratch: %s", e)
+    return load_url(driver, url, config)
+
+def get_ready_xpath(url, config):
+    """
+    Return the XPath of the element that signals the dashboard at `url` has
+    rendered its dynamic content, as configured in `ready_xpaths`, or None.
+    """
+    key = url_key(url)
+    for site_identifier, xpath in config.ready_xpaths.items():
+        if site_identifier in key:
+            return xpath
+    return None
+
+def start_navigation(driver, url, config):
+    """
+    Start loading `url` in the current tab without waiting for the page load,
+    using CDP Page.navigate on Chrome and a deferred script navigation
+    elsewhere. Returns False if the navigation is already known to have failed.
+    """
+    if config.browser == 'chrome':
+        try:
+            result = driver.execute_cdp_cmd("Page.navigate", {"url": url})
+            if result.get('errorText'):
+                logging.error("Failed to load %s: %s", url, result['errorText'])
+                return False
+            return True
+        except WebDriverException as e:
+            logging.warning("CDP navigation failed, falling back to a script navigation: %s", e)
+            log_traceback()
+    # Defer the navigation so execute_script returns without waiting for it
+    driver.execute_script("var url = arguments[0]; setTimeout(function() { window.location.href = url; }, 0);", url)
+    return True
+
+def switch_to_tab(driver, handle):
+    """Make `handle` the current tab, skipping the switch when it already is."""
+    if driver._md_current_handle == handle and not driver._md_in_frame:
+        return
+    driver.switch_to.window(handle)
+    driver._md_current_handle = handle
+    driver._md_in_frame = False
+
+def open_blank_tab(driver, config):
+    """
+    Open a blank tab without switching to it, with CDP Target.createTarget on
+    Chrome and from a script elsewhere.
+    """
+    if config.browser == 'chrome':
+        try:
+            driver.execute_cdp_cmd("Target.createTarget", {"url": "about:blank", "background": True})
+            return
+        except WebDriverException as e:
+            logging.warning("CDP tab creation failed, falling back to window.open: %s", e)
+            log_traceback()
+    driver.execute_script("window.open('');")
+
+def open_tabs(driver, urls, config):
+    """
+    Open one tab per URL and return a {url: window_handle} mapping.
+    All tabs are created and their navigations started before waiting on any
+    of them, so the pages load side by side in the browser and startup takes
+    as long as the slowest dashboard instead of the sum of all of them.
+    """
+    # Create the blank tabs first: a navigation pending in the current tab
+    # would make chromedriver block the next command issued against it.
+    initial_handle = driver.current_window_handle
+    existing_handles = set(driver.window_handles)
+    for _ in urls[1:]:
+        open_blank_tab(driver, config)
+    expected_count = len(existing_handles) + len(urls) - 1
+    WebDriverWait(driver, 10, poll_frequency=WAIT_POLL_FREQUENCY).until(
+        lambda d: len(d.window_handles) >= expected_count)
+    new_handles = [h for h in driver.window_handles if h not in existing_handles]
+    for handle in new_handles:
+        switch_to_tab(driver, handle)
+        prepare_tab(driver, config)
+    handles = [initial_handle] + new_handles
+
+    tabs = {}
+    failed_urls = set()
+    for url, handle in zip(urls, handles):
+        logging.info("Opening tab for URL: %s", url)
+        switch_to_tab(driver, handle)
+        apply_auth_headers(driver, url, config)
+        if not start_navigation(driver, url, config):
+            failed_urls.add(url)
+        tabs[url] = handle
+
+    for url, handle in tabs.items():
+        if url in failed_urls:
+            # The tab shows an error page that will never become ready
+            continue
+        switch_to_tab(driver, handle)
+        wait_for_page_load(driver, config.page_load_timeout, get_ready_xpath(url, config),
+                           READY_STATES.get(config.page_load_strategy, READY_STATES['normal']))
+    return tabs
+
 def execute_pre_actions(driver, url, config):
-    if config.get('run_pre_actions', False):
-        executed_pre_action = False
-        for site_identifier, pre_action in PRE_ACTIONS.items():
-            if site_identifier in url.lower():
-                logging.debug(f"Executing pre-action for site: {site_identifier}")
-                pre_action(driver)
-                executed_pre_action = True
-                break  # Assuming one pre-action per URL
-        if not executed_pre_action:
+    if config.run_pre_actions:
+        match = get_pre_action(url)
+        if match:
+            site_identifier, pre_action = match
+            logging.debug("Executing pre-action for site: %s", site_identifier)
+            pre_action(driver)
+            # Pre-actions may leave the driver inside a frame of the tab
+            driver._md_in_frame = True
+        else:
             logging.debug("No pre-action defined for this URL.")
 
 
+# Seconds to let the driver poll for a site's scroll container
+CONTAINER_WAIT = 2
+
+# URL -> scroll container selector found on its page by handle_scrolling(),
+# or None when the waited lookup did not find one
+_SCROLL_SELECTOR_CACHE = {}
+
+@contextlib.contextmanager
+def implicit_wait(driver, seconds):
+    """
+    Temporarily enable the driver's implicit wait, so element lookups are
+    polled inside the driver instead of by client-side retries. The script
+    otherwise runs with no implicit wait, so it is reset to 0 afterwards.
+    """
+    driver.implicitly_wait(seconds)
+    try:
+        yield
+    finally:
+        driver.implicitly_wait(0)
+
 def handle_scrolling(driver, url, config):
     try:
-        # Get scrollable element selector for Grafana
-        scrollable_element_selector = None
-        if "grafana" in url.lower():
+        # Get scrollable element selector for sites that scroll a container (e.g. Grafana)
+        scrollable_element_selector = _SCROLL_SELECTOR_CACHE.get(url)
+        container_selector = get_scroll_container_selector(url)
+        if container_selector and not scrollable_element_selector:
+            # Only the first lookup lets the driver poll for a container that renders
+            # late; after a miss the page is checked again without waiting
+            if url in _SCROLL_SELECTOR_CACHE:
+                lookup_wait = contextlib.nullcontext()
+            else:
+                lookup_wait = implicit_wait(driver, CONTAINER_WAIT)
+                _SCROLL_SELECTOR_CACHE[url] = None
             try:
-                element = driver.find_element(By.CSS_SELECTOR, 'div.scrollbar-view')
+                with lookup_wait:
+                    element = driver.find_element(By.CSS_SELECTOR, container_selector)
                 if element.is_displayed():
-                    scrollable_element_selector = 'div.scrollbar-view'
+                    scrollable_element_selector = container_selector
+                    _SCROLL_SELECTOR_CACHE[url] = container_selector
             except NoSuchElementException:
-                logging.debug("No Grafana scrollable container found")
+                logging.debug("No scrollable container found for selector: %s", container_selector)
 
         # Try to scroll
         try:
             scroll_page(driver, config, scrollable_element_selector)
             return True, False  # Success, no restart needed
         except (TimeoutException, WebDriverException) as e:
-            logging.warning(f"Scroll failed, trying refresh: {e}")
+            logging.warning("Scroll failed, trying refresh: %s", e)
             try:
                 driver.refresh()
-                wait_for_page_load(driver, config.get('page_load_timeout', 30))
+                wait_for_page_load(driver, config.page_load_timeout, get_ready_xpath(url, config))
                 scroll_page(driver, config, scrollable_element_selector)
                 return True, False  # Success after refresh
             except Exception as refresh_error:
-                logging.error(f"Refresh failed, needs restart: {refresh_error}")
+                logging.error("Refresh failed, needs restart: %s", refresh_error)
                 return False, True  # Failed, needs restart
 
     except Exception as e:
-        logging.error(f"Unexpected error: {e}")
+        logging.error("Unexpected error: %s", e)
         return False, True  # Failed, needs restart
 
 # ------------------ Main Function ------------------
-def restart_browser(config):
-    """Restart the browser and return a new driver instance"""
+def restart_browser(config, max_attempts=3):
+    """
+    Restart the browser and return a new driver instance. Launch failures
+    reported by the browser or driver are retried with exponential backoff
+    (2s, 4s, ...); any other error is raised straight away.
+    """
+    for attempt in range(1, max_attempts + 1):
+        try:
+            driver = init_driver(config)
+            return driver
+        except WebDriverException as e:
+            if attempt == max_attempts:
+                logging.error("Failed to restart browser after %s attempts: %s", attempt, e)
+                log_traceback()
+                raise
+            delay = 2 ** attempt
+            logging.warning("Failed to restart browser (attempt %s/%s), retrying in %s seconds: %s",
+                            attempt, max_attempts, delay, e)
+            time.sleep(delay)
+        except Exception as e:
+            logging.error("Failed to restart browser: %s", e)
+            log_traceback()
+            raise
+
+def recover_browser(driver, config):
+    """
+    Return a usable driver after the current tab stopped responding. If the
+    session is still alive, the failed tab is replaced by a fresh blank one,
+    which is left current; otherwise the browser is restarted.
+    """
     try:
-        driver = init_driver(config)
+        failed_handle = driver._md_current_handle
+        driver.switch_to.new_window('tab')
+        fresh_handle = driver._md_current_handle = driver.current_window_handle
+        driver._md_in_frame = False
+        switch_to_tab(driver, failed_handle)
+        driver.close()
+        driver._md_tab_headers.pop(failed_handle, None)
+        switch_to_tab(driver, fresh_handle)
+        prepare_tab(driver, config)
+        logging.info("Browser session is still alive. Replaced the failed tab with a fresh one.")
         return driver
+    except WebDriverException as e:
+        logging.warning("Browser session is unusable, relaunching the browser: %s", e)
+
+    try:
+        driver.quit()
     except Exception as e:
-        logging.error(f"Failed to restart browser: {e}")
-        logging.debug(traceback.format_exc())
-        raise
+        logging.error("Error while closing browser: %s", e)
+    return restart_browser(config)
 
 def main():
-    config = load_config()
-    urls = config.get('urls', [])
+    config = build_settings(load_config())
+    urls = config.urls
     if not urls:
         logging.error("No URLs provided in the configuration.")
         return
 
-    configure_logging(config.get('log_level', 'INFO'), config.get('log_file', 'dashboard_rotator.log'))
+    configure_logging(config.log_level, config.log_file)
 
     logging.info("Starting the dashboard rotator script.")
 
@@ -463,42 +934,24 @@ def main():
     try:
         driver = init_driver(config)
 
-        mode = config.get('mode', 'SingleTab').lower()
-        do_periodic_refresh = config.get('do_periodic_refresh', False)
-        refresh_interval = config.get('refresh_interval', 3600)
+        mode = config.mode
+        do_periodic_refresh = config.do_periodic_refresh
+        refresh_interval = config.refresh_interval
 
         if mode == 'multitab':
-            # Multi-tab mode: open each URL in a separate tab
-            tabs = {}
+            # Multi-tab mode: open each URL in a separate tab, loading them concurrently
+            tabs = open_tabs(driver, urls, config)
             last_refresh_times = {}
-
-            # Open each URL in a separate tab
-            for idx, url in enumerate(urls):
-                if idx == 0:
-                    logging.info(f"Loading URL in initial tab: {url}")
-                    success = load_url(driver, url, config)
-                    if not success:
-                        logging.error(f"Failed to load URL: {url}")
-                        continue
-                    tabs[url] = driver.current_window_handle
-                else:
-                    logging.info(f"Opening new tab for URL: {url}")
-                    driver.execute_script("window.open('');")
-                    driver.switch_to.window(driver.window_handles[-1])
-                    success = load_url(driver, url, config)
-                    if not success:
-                        logging.error(f"Failed to load URL: {url}")
-                        continue
-                    tabs[url] = driver.current_window_handle
-
+            for url in urls:
                 # Initialize last refresh time for each tab
                 last_refresh_times[url] = time.time()
 
             # Main loop to rotate between tabs
             while True:
                 for url in urls:
-                    logging.info(f"Switching to URL: {url}")
-                    driver.switch_to.window(tabs[url])
+                    logging.info("Switching to URL: %s", url)
+                    switch_to_tab(driver, tabs[url])
+                    wake_tab(driver, config)
 
                     # Optionally refresh the tab if doPeriodicRefresh is True and refresh interval has passed
                     if do_periodic_refresh:
@@ -511,37 +964,33 @@ def main():
                     success, needs_restart = handle_scrolling(driver, url, config)
                     if not success:
                         if needs_restart:
-                            logging.warning(f"Scrolling failed for {url}, restarting browser")
-                            driver.quit()
-                            driver = restart_browser(config)
-                            
+                            logging.warning("Scrolling failed for %s, restarting browser", url)
+                            new_driver = recover_browser(driver, config)
+
+                            if new_driver is driver:
+                                # The session survived and the other tabs are still loaded:
+                                # only reopen the failed URL in the fresh tab
+                                tabs.update(open_tabs(driver, [url], config))
+                                last_refresh_times[url] = time.time()
+                                continue
+
                             # Reopen all tabs
-                            tabs.clear()
-                            for idx, url_to_reopen in enumerate(urls):
-                                if idx == 0:
-                                    success = load_url(driver, url_to_reopen, config)
-                                    if success:
-                                        tabs[url_to_reopen] = driver.current_window_handle
-                                else:
-                                    driver.execute_script("window.open('');")
-                                    driver.switch_to.window(driver.window_handles[-1])
-                                    success = load_url(driver, url_to_reopen, config)
-                                    if success:
-                                        tabs[url_to_reopen] = driver.current_window_handle
-                            
+                            driver = new_driver
+                            tabs = open_tabs(driver, urls, config)
+
                             # Reset refresh times
                             for refresh_url in urls:
                                 last_refresh_times[refresh_url] = time.time()
                             break  # Break the URL loop to start fresh after browser restart
                         else:
-                            logging.warning(f"Scrolling failed for {url}, moving to next URL")
+                            logging.warning("Scrolling failed for %s, moving to next URL", url)
                             continue
 
         else:
             # Single-tab mode: load each URL in the same tab
             while True:
                 for url in urls:
-                    logging.info(f"Loading URL: {url}")
+                    logging.info("Loading URL: %s", url)
                     success = load_url(driver, url, config)
                     if not success:
                         continue  # Skip to the next URL
@@ -553,42 +1002,23 @@ def main():
                     success, needs_restart = handle_scrolling(driver, url, config)
                     if not success:
                         if needs_restart:
-                            logging.warning(f"Scrolling failed for {url}, restarting browser")
-                            driver.quit()
-                            driver = restart_browser(config)
-                            
-                            # Reopen all tabs
-                            tabs.clear()
-                            for idx, url_to_reopen in enumerate(urls):
-                                if idx == 0:
-                                    success = load_url(driver, url_to_reopen, config)
-                                    if success:
-                                        tabs[url_to_reopen] = driver.current_window_handle
-                                else:
-                                    driver.execute_script("window.open('');")
-                                    driver.switch_to.window(driver.window_handles[-1])
-                                    success = load_url(driver, url_to_reopen, config)
-                                    if success:
-                                        tabs[url_to_reopen] = driver.current_window_handle
-                            
-                            # Reset refresh times
-                            for refresh_url in urls:
-                                last_refresh_times[refresh_url] = time.time()
+                            logging.warning("Scrolling failed for %s, restarting browser", url)
+                            driver = recover_browser(driver, config)
                             break  # Break the URL loop to start fresh after browser restart
                         else:
-                            logging.warning(f"Scrolling failed for {url}, moving to next URL")
+                            logging.warning("Scrolling failed for %s, moving to next URL", url)
                             continue
 
 
     except Exception as e:
-        logging.error(f"An unexpected error occurred: {e}")
-        logging.debug(traceback.format_exc())
+        logging.error("An unexpected error occurred: %s", e)
+        log_traceback()
     finally:
         try:
             if driver:
                 driver.quit()
         except Exception as e:
-            logging.error(f"Error while closing browser: {e}")
+            logging.error("Error while closing browser: %s", e)
         logging.info("Dashboard rotator script has stopped.")
 
 